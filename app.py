@@ -1,15 +1,23 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, g, has_request_context, make_response, send_from_directory, abort
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.utils import safe_join
 from functools import wraps
-from datetime import datetime
+from datetime import datetime, timezone
 import docker
+import requests
 import os
 import subprocess
 import json
 import glob
+import itertools
+import mimetypes
+import threading
+import time
+from collections import deque
 from dotenv import load_dotenv
+from assets import BUNDLES, STATIC_DIR, DIST_DIR, load_manifest
 
 # Raspberry Pi specific imports (graceful fallback for non-Pi systems)
 RPI_AVAILABLE = os.getenv('RPI_AVAILABLE', 'true').lower() == 'true'
@@ -25,6 +33,13 @@ if RPI_AVAILABLE:
 else:
     print("🖥️  Running in Mac/Development mode - GPIO disabled")
 
+# inotify is Linux-only; without it project state is re-read on every request
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
 load_dotenv()
 
 app = Flask(__name__)
@@ -41,7 +56,162 @@ def load_user(user_id):
     return User.query.get(int(user_id))
 
 # Docker client
-docker_client = docker.from_env(version=os.getenv('DOCKER_API_VERSION'))
+# Connections kept per process; size it to the worker's thread count so concurrent
+# requests don't overflow the pool (only request threads call Docker)
+DOCKER_MAX_POOL_SIZE = int(os.getenv('DOCKER_MAX_POOL_SIZE', '12'))
+DOCKER_CONNECT_TIMEOUT = float(os.getenv('DOCKER_CONNECT_TIMEOUT', '2'))
+DOCKER_READ_TIMEOUTS = {
+    'list': float(os.getenv('DOCKER_LIST_TIMEOUT', '10')),
+    'inspect': float(os.getenv('DOCKER_INSPECT_TIMEOUT', '5')),
+    'stats': float(os.getenv('DOCKER_STATS_TIMEOUT', '10')),
+    'logs': float(os.getenv('DOCKER_LOGS_TIMEOUT', '15')),
+    # start/stop/restart; must exceed the 10s stop grace period
+    'stop': float(os.getenv('DOCKER_STOP_TIMEOUT', '30')),
+}
+DOCKER_BREAKER_THRESHOLD = int(os.getenv('DOCKER_BREAKER_THRESHOLD', '3'))  # consecutive failures
+DOCKER_BREAKER_RESET = float(os.getenv('DOCKER_BREAKER_RESET', '30'))  # seconds before a retry
+DOCKER_CACHE_SIZE = 256
+
+docker_call_context = threading.local()
+
+# The per-call timeouts hook a private docker-py method (requirements.txt pins the
+# tested range); fail at startup rather than silently fall back to the 60s default
+if not hasattr(docker.APIClient, '_set_request_timeout'):
+    raise RuntimeError("Unsupported docker SDK: APIClient._set_request_timeout not found")
+
+class DashboardAPIClient(docker.APIClient):
+    """APIClient whose request timeout can be overridden per call by docker_call()."""
+
+    def _set_request_timeout(self, kwargs):
+        timeout = getattr(docker_call_context, 'timeout', None)
+        if timeout is not None:
+            # Also replaces the timeout stop/restart compute from the client default
+            kwargs['timeout'] = timeout
+        else:
+            kwargs.setdefault('timeout', self.timeout)
+        return kwargs
+
+class DashboardDockerClient(docker.DockerClient):
+    def __init__(self, *args, **kwargs):
+        self.api = DashboardAPIClient(*args, **kwargs)
+
+class DockerUnavailableError(Exception):
+    pass
+
+class DockerCircuitBreaker:
+    """Stops calling dockerd after repeated connection failures or timeouts.
+
+    While open, one trial call is let through every reset_timeout seconds; a
+    successful call closes the breaker again.
+    """
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+    def state(self):
+        with self.lock:
+            return {
+                'open': self.opened_at is not None,
+                'consecutive_failures': self.failures
+            }
+
+docker_client = DashboardDockerClient(version=os.getenv('DOCKER_API_VERSION'),
+                                      max_pool_size=DOCKER_MAX_POOL_SIZE,
+                                      **docker.utils.kwargs_from_env())
+docker_breaker = DockerCircuitBreaker(DOCKER_BREAKER_THRESHOLD, DOCKER_BREAKER_RESET)
+docker_cache_lock = threading.Lock()
+docker_cache = {}  # cache key -> last successful result, served while dockerd is unresponsive
+docker_metrics_lock = threading.Lock()
+docker_metrics = {
+    'in_flight': 0,
+    'peak_in_flight': 0,
+    'saturated_calls': 0,  # calls started while every pooled connection was busy
+    'rejected_calls': 0,
+    'stale_responses': 0,
+    'calls': {call_class: {'count': 0, 'failures': 0, 'timeouts': 0, 'total_seconds': 0.0}
+              for call_class in DOCKER_READ_TIMEOUTS}
+}
+
+def docker_cached_result(cache_key, error):
+    with docker_cache_lock:
+        cached = cache_key is not None and cache_key in docker_cache
+        result = docker_cache[cache_key] if cached else None
+    if not cached:
+        raise DockerUnavailableError(f"Docker daemon is not responding: {error}")
+    with docker_metrics_lock:
+        docker_metrics['stale_responses'] += 1
+    if has_request_context():
+        g.docker_stale = True
+    return result
+
+def docker_call(call_class, fn, cache_key=None):
+    """Run fn against dockerd with the call class's timeouts behind the circuit breaker."""
+    if not docker_breaker.allow():
+        with docker_metrics_lock:
+            docker_metrics['rejected_calls'] += 1
+        return docker_cached_result(cache_key, 'circuit breaker open')
+
+    with docker_metrics_lock:
+        docker_metrics['in_flight'] += 1
+        docker_metrics['peak_in_flight'] = max(docker_metrics['peak_in_flight'], docker_metrics['in_flight'])
+        if docker_metrics['in_flight'] > DOCKER_MAX_POOL_SIZE:
+            docker_metrics['saturated_calls'] += 1
+        docker_metrics['calls'][call_class]['count'] += 1
+
+    started = time.monotonic()
+    docker_call_context.timeout = (DOCKER_CONNECT_TIMEOUT, DOCKER_READ_TIMEOUTS[call_class])
+    try:
+        result = fn()
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+        docker_breaker.record_failure()
+        with docker_metrics_lock:
+            docker_metrics['calls'][call_class]['failures'] += 1
+            if isinstance(e, requests.exceptions.Timeout):
+                docker_metrics['calls'][call_class]['timeouts'] += 1
+        return docker_cached_result(cache_key, e)
+    except docker.errors.APIError:
+        # dockerd answered (e.g. 404 for a missing container), so it is healthy
+        docker_breaker.record_success()
+        raise
+    finally:
+        docker_call_context.timeout = None
+        with docker_metrics_lock:
+            docker_metrics['in_flight'] -= 1
+            docker_metrics['calls'][call_class]['total_seconds'] += time.monotonic() - started
+
+    docker_breaker.record_success()
+    if cache_key is not None:
+        with docker_cache_lock:
+            # Re-inserting moves the key to the end, so the oldest entry is evicted first
+            docker_cache.pop(cache_key, None)
+            docker_cache[cache_key] = result
+            while len(docker_cache) > DOCKER_CACHE_SIZE:
+                docker_cache.pop(next(iter(docker_cache)))
+    return result
 
 # Models
 class User(UserMixin, db.Model):
@@ -69,47 +239,189 @@ def roles_required(*roles):
         return wrapped_function
     return decorator
 
+# Static assets (built by assets.py)
+ASSET_MAX_AGE = 31536000  # one year; fingerprinted files never change
+asset_manifest = load_manifest()
+
+def asset_urls(name):
+    if name in asset_manifest:
+        return [url_for('static', filename='dist/' + asset_manifest[name])]
+    # Not built: serve the unbundled sources
+    return [url_for('static', filename=source) for source in BUNDLES[name]
+            if os.path.exists(os.path.join(STATIC_DIR, source))]
+
+@app.context_processor
+def inject_asset_urls():
+    return {'asset_urls': asset_urls}
+
+@app.route('/static/dist/<path:filename>')
+def dist_asset(filename):
+    path = safe_join(DIST_DIR, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+
+    # Serve the pre-compressed variant written at build time when the client accepts it
+    mimetype = mimetypes.guess_type(filename)[0]
+    encoding = None
+    for candidate, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if candidate in request.accept_encodings and os.path.isfile(path + suffix):
+            encoding = candidate
+            filename += suffix
+            break
+
+    response = send_from_directory(DIST_DIR, filename, mimetype=mimetype, max_age=ASSET_MAX_AGE)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = f'public, max-age={ASSET_MAX_AGE}, immutable'
+    return response
+
+# Rendered pages keyed by template and user; the HTML only changes with templates or assets
+rendered_page_cache = {}
+
+def render_cached_page(template):
+    user_key = None
+    if current_user.is_authenticated:
+        user_key = (current_user.id, current_user.username, current_user.role)
+    key = (template, user_key)
+    html = rendered_page_cache.get(key)
+    if html is None or app.debug:
+        html = render_template(template)
+        rendered_page_cache[key] = html
+
+    # Browsers revalidate the page itself and get a 304 when nothing changed
+    response = make_response(html)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.add_etag()
+    return response.make_conditional(request)
+
 # Routes
 @app.route('/')
 def home():
-    return render_template('index.html')
+    return render_cached_page('index.html')
 
 @app.route('/admin')
 @login_required
 @roles_required('read-only','operator','admin')
 def admin():
-    containers = docker_client.containers.list(all=True)
-    container_info = []
-    for container in containers:
-        try:
-            image_name = container.attrs['Config']['Image']
-        except (KeyError, TypeError):
-            image_name = 'unknown'
+    # Container rows are loaded page by page from /api/containers
+    return render_cached_page('admin.html')
+
+# Container listing helpers
+CONTAINER_SORT_KEYS = ('name', 'status', 'image', 'created')
+CONTAINER_PAGE_SIZE_MAX = 200
+CONTAINER_LAZY_FIELDS = ('env', 'volumes')
+
+class ContainerRecord:
+    """The handful of container fields the dashboard lists, built from a sparse list summary."""
+
+    __slots__ = ('id', 'name', 'status', 'image', 'created', 'host_port')
+
+    def __init__(self, summary):
+        names = summary.get('Names') or []
+        created = summary.get('Created')
+        self.id = summary['Id']
+        self.name = names[0].lstrip('/') if names else self.id[:12]
+        self.status = summary.get('State') or 'unknown'
+        self.image = summary.get('Image') or 'unknown'
+        self.created = datetime.fromtimestamp(created, timezone.utc).isoformat() if created else ''
 
         # Get the first mapped host port (if any)
-        ports = container.attrs['NetworkSettings']['Ports']
-        host_port = None
-        if ports:
-            for container_port, mappings in ports.items():
-                if mappings and isinstance(mappings, list):
-                    host_port = mappings[0].get('HostPort')
-                    break
-
-        # Build URL on same host instead of localhost
-        container_url = None
-        if host_port:
-            base = request.host_url.rstrip('/').rsplit(':', 1)[0]
-            container_url = f"{base}:{host_port}"
-
-        container_info.append({
-            'id': container.id,
-            'name': container.name,
-            'status': container.status,
-            'image': image_name,
-            'host_port': host_port,
-            'url': container_url
-        })
-    return render_template('admin.html', containers=container_info)
+        self.host_port = None
+        for port in summary.get('Ports') or []:
+            if port.get('PublicPort'):
+                self.host_port = str(port['PublicPort'])
+                break
+
+    def to_dict(self, base_url):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'image': self.image,
+            'created': self.created,
+            'host_port': self.host_port,
+            # Build URL on same host instead of localhost
+            'url': f"{base_url}:{self.host_port}" if self.host_port else None
+        }
+
+def list_container_records(filters=None):
+    filters = filters or {}
+
+    def fetch():
+        # sparse=True skips the per-container inspect; only the list summary is fetched
+        containers = docker_client.containers.list(all=True, filters=filters, sparse=True)
+        # Building a record from the summary is cheap, so records are not kept between requests
+        return [ContainerRecord(container.attrs) for container in containers]
+
+    return docker_call('list', fetch, cache_key=('list', json.dumps(filters, sort_keys=True)))
+
+def build_container_filters(args):
+    # Push filters down to the Docker daemon so it does the matching
+    filters = {}
+    status = args.get('status')
+    if status:
+        filters['status'] = status
+    name = args.get('name')
+    if name:
+        filters['name'] = name
+    # Image is matched as a substring in list_containers(); Docker's ancestor
+    # filter needs an exact reference and also matches derived images
+    labels = args.getlist('label')
+    if labels:
+        filters['label'] = labels
+    return filters
+
+@app.route('/api/containers', methods=['GET'])
+@login_required
+@roles_required('read-only','operator','admin')
+def list_containers():
+    try:
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = request.args.get('per_page', 25, type=int)
+        per_page = min(max(per_page, 1), CONTAINER_PAGE_SIZE_MAX)
+        sort = request.args.get('sort', 'name')
+        if sort not in CONTAINER_SORT_KEYS:
+            return jsonify(success=False, error='Invalid sort key'), 400
+        reverse = request.args.get('order', 'asc') == 'desc'
+
+        records = list_container_records(build_container_filters(request.args))
+        image = request.args.get('image', '').lower()
+        if image:
+            records = [record for record in records if image in record.image.lower()]
+        base = request.host_url.rstrip('/').rsplit(':', 1)[0]
+        rows = [record.to_dict(base) for record in records]
+
+        rows.sort(key=lambda row: row[sort] or '', reverse=reverse)
+        total = len(rows)
+        pages = (total + per_page - 1) // per_page
+        # Requests past the end (e.g. after filtering) get the last page
+        page = min(page, max(pages, 1))
+        start = (page - 1) * per_page
+
+        return jsonify(success=True,
+                       containers=rows[start:start + per_page],
+                       page=page,
+                       per_page=per_page,
+                       total=total,
+                       pages=pages,
+                       stale=g.get('docker_stale', False))
+    except Exception as e:
+        return jsonify(success=False, error=str(e)), 400
+
+# Docker Client Metrics Route
+@app.route('/api/docker/metrics', methods=['GET'])
+@login_required
+@roles_required('read-only','operator','admin')
+def docker_client_metrics():
+    with docker_metrics_lock:
+        metrics = json.loads(json.dumps(docker_metrics))
+    metrics['pool_size'] = DOCKER_MAX_POOL_SIZE
+    metrics['pool_utilization'] = round(metrics['in_flight'] / DOCKER_MAX_POOL_SIZE, 2)
+    metrics['breaker'] = docker_breaker.state()
+    with docker_cache_lock:
+        metrics['cached_results'] = len(docker_cache)
+    return jsonify(success=True, metrics=metrics)
 
 # Container Info Route
 @app.route('/container/<container_id>/info', methods=['GET'])
@@ -117,22 +429,34 @@ def admin():
 @roles_required('read-only','operator','admin')
 def container_info(container_id):
     try:
-        container = docker_client.containers.get(container_id)
-        info = {
-            'id': container.id,
-            'name': container.name,
-            'status': container.status,
-            'image': container.attrs['Config']['Image'],
-            'created': container.attrs['Created'],
-            'ports': container.attrs['NetworkSettings']['Ports'],
-            'labels': container.attrs['Config'].get('Labels', {}),
-            'env': container.attrs['Config'].get('Env', []),
-            'command': container.attrs['Config'].get('Cmd', []),
-            'volumes': container.attrs['HostConfig'].get('Binds', []),
-            'networks': list(container.attrs['NetworkSettings']['Networks'].keys()),
-            'restart_policy': container.attrs['HostConfig'].get('RestartPolicy', {}),
-        }
-        return jsonify(success=True, info=info)
+        # env and volumes can be large, so they are only returned when asked for
+        include = tuple(sorted(field for field in request.args.get('include', '').split(',')
+                               if field in CONTAINER_LAZY_FIELDS))
+
+        def fetch():
+            attrs = docker_client.api.inspect_container(container_id)
+            state = attrs.get('State') or {}
+            info = {
+                'id': attrs['Id'],
+                'name': attrs['Name'].lstrip('/'),
+                'status': state.get('Status'),
+                'image': attrs['Config']['Image'],
+                'created': attrs['Created'],
+                'ports': attrs['NetworkSettings']['Ports'],
+                'labels': attrs['Config'].get('Labels', {}),
+                'command': attrs['Config'].get('Cmd', []),
+                'networks': list(attrs['NetworkSettings']['Networks'].keys()),
+                'restart_policy': attrs['HostConfig'].get('RestartPolicy', {}),
+            }
+            if 'env' in include:
+                info['env'] = attrs['Config'].get('Env', [])
+            if 'volumes' in include:
+                info['volumes'] = attrs['HostConfig'].get('Binds', [])
+            # Only the projection is kept; the full inspect blob is dropped here
+            return info
+
+        info = docker_call('inspect', fetch, cache_key=('inspect', container_id, include))
+        return jsonify(success=True, info=info, stale=g.get('docker_stale', False))
     except Exception as e:
         return jsonify(success=False, error=str(e)), 400
 
@@ -142,8 +466,7 @@ def container_info(container_id):
 @roles_required('read-only','operator','admin')
 def container_logs(container_id):
     try:
-        container = docker_client.containers.get(container_id)
-        logs = container.logs(tail=100, timestamps=True).decode('utf-8')
+        logs = docker_call('logs', lambda: docker_client.api.logs(container_id, tail=100, timestamps=True)).decode('utf-8')
         return jsonify(success=True, logs=logs)
     except Exception as e:
         return jsonify(success=False, error=str(e)), 400
@@ -154,8 +477,7 @@ def container_logs(container_id):
 @roles_required('read-only','operator','admin')
 def container_stats(container_id):
     try:
-        container = docker_client.containers.get(container_id)
-        stats = container.stats(stream=False)
+        stats = docker_call('stats', lambda: docker_client.api.stats(container_id, stream=False))
         
         # Calculate CPU percentage
         cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
@@ -197,7 +519,7 @@ def container_stats(container_id):
 def global_stats():
     try:
         # Get container stats
-        containers = docker_client.containers.list(all=True)
+        containers = list_container_records()
         running_containers = [c for c in containers if c.status == 'running']
         
         # Get system stats
@@ -238,7 +560,7 @@ def global_stats():
             }
         }
         
-        return jsonify(success=True, stats=stats)
+        return jsonify(success=True, stats=stats, stale=g.get('docker_stale', False))
     except Exception as e:
         return jsonify(success=False, error=str(e)), 400
 
@@ -368,18 +690,308 @@ def gpio_set_pin(pin):
     except Exception as e:
         return jsonify(success=False, error=str(e)), 400
 
+# Project Watching
+PROJECTS_DIR = os.path.expanduser('~/projects')
+PROJECT_WATCH_LIMIT = int(os.getenv('PROJECT_WATCH_LIMIT', '4096'))  # inotify watch descriptors
+# Heavy directories left unwatched, but only when git ignores them (see git_ignores_dir)
+PROJECT_WATCH_IGNORED_DIRS = {
+    'node_modules', '.venv', 'venv', 'env', '__pycache__', '.tox', '.nox',
+    '.mypy_cache', '.pytest_cache', '.ruff_cache', '.cache', '.next', 'dist', 'build', 'target'
+}
+
+def git_ignores_dir(parent, name):
+    """Return True/False for whether git ignores parent/name, or None outside a git repo."""
+    try:
+        result = subprocess.run(['git', '-C', parent, 'check-ignore', '-q', name],
+                                capture_output=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    # 0: ignored, 1: not ignored, anything else: not a repository (or git failed)
+    if result.returncode in (0, 1):
+        return result.returncode == 0
+    return None
+
+class ProjectWatcher:
+    """Watches ~/projects with inotify and tracks which projects need their git state re-read.
+
+    Every change inside a project bumps its generation; cached values computed for an
+    older generation are recomputed on the next request. Projects that could not be
+    fully watched (watch limit reached) are never served from cache. Until the watches
+    are built (and while they are rebuilt after an event overflow) requests read
+    everything from disk.
+    """
+
+    def __init__(self, projects_dir, watch_limit):
+        self.projects_dir = projects_dir
+        self.watch_limit = watch_limit
+        self.lock = threading.Lock()  # guards projects, unwatched and active
+        self.thread = None
+        self.inotify = None
+        self.active = False
+        self.watches = {}  # wd -> (project name or None for the projects dir, path); watcher thread only
+        self.projects = {}  # name -> {'generation': int, 'cache': {kind: (generation, value)}}
+        self.unwatched = set()
+        # Shared across projects so a rebuilt record never reuses an older generation
+        self.generations = itertools.count(1)
+
+    def start(self):
+        if not INOTIFY_AVAILABLE:
+            return
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self.run, name='project-watcher', daemon=True)
+            self.thread.start()
+
+    def run(self):
+        try:
+            self.scan()
+        except Exception as e:
+            print(f"⚠️  Project watcher unavailable: {e}")
+            return
+
+        while True:
+            try:
+                events = self.inotify.read(timeout=1000)
+                if any(event.mask & inotify_flags.Q_OVERFLOW for event in events):
+                    # Events were dropped, so neither the watches nor the project list can be trusted
+                    self.scan()
+                    continue
+                for event in events:
+                    self.handle_event(event)
+            except Exception as e:
+                print(f"⚠️  Project watcher failed: {e}")
+                time.sleep(1)
+
+    def scan(self):
+        # Walk outside the lock; requests fall back to reading from disk until this publishes
+        with self.lock:
+            self.active = False
+        if self.inotify is not None:
+            self.inotify.close()
+        self.inotify = INotify()
+        self.watches = {}
+
+        self.add_watch(None, self.projects_dir, self.root_mask())
+        projects = {}
+        unwatched = set()
+        for name in os.listdir(self.projects_dir):
+            path = os.path.join(self.projects_dir, name)
+            if not os.path.isdir(path):
+                continue
+            projects[name] = {'generation': next(self.generations), 'cache': {}}
+            if not self.watch_tree(name, path):
+                unwatched.add(name)
+
+        with self.lock:
+            self.projects = projects
+            self.unwatched = unwatched
+            self.active = True
+
+    def root_mask(self):
+        return (inotify_flags.CREATE | inotify_flags.DELETE | inotify_flags.MOVED_FROM |
+                inotify_flags.MOVED_TO | inotify_flags.ONLYDIR)
+
+    def tree_mask(self):
+        return (inotify_flags.CREATE | inotify_flags.DELETE | inotify_flags.MODIFY |
+                inotify_flags.ATTRIB | inotify_flags.MOVED_FROM | inotify_flags.MOVED_TO |
+                inotify_flags.ONLYDIR)
+
+    def add_watch(self, project, path, mask):
+        if len(self.watches) >= self.watch_limit:
+            return False
+        try:
+            wd = self.inotify.add_watch(path, mask)
+        except OSError:
+            return False
+        self.watches[wd] = (project, path)
+        return True
+
+    def remove_watches(self, project, path=None):
+        for wd, (watched_project, watched_path) in list(self.watches.items()):
+            if watched_project != project:
+                continue
+            if path is None or watched_path == path or watched_path.startswith(path + os.sep):
+                self.watches.pop(wd, None)
+                try:
+                    self.inotify.rm_watch(wd)
+                except OSError:
+                    pass
+
+    def skip_dir(self, project, parent, name):
+        if name not in PROJECT_WATCH_IGNORED_DIRS:
+            return False
+        ignored = git_ignores_dir(parent, name)
+        if ignored is None:
+            # No answer from git: safe to skip only when there is no git state to keep fresh
+            return not os.path.exists(os.path.join(self.projects_dir, project, '.git'))
+        return ignored
+
+    def git_parts(self, project, path):
+        # Path components below the project root, e.g. ['.git', 'refs', 'heads']
+        return os.path.relpath(path, os.path.join(self.projects_dir, project)).split(os.sep)
+
+    def is_git_watch_dir(self, project, path):
+        # .git itself (HEAD, index, packed-refs) and refs/heads, where branch updates land;
+        # branch names may contain slashes, so everything below heads is watched too
+        parts = self.git_parts(project, path)
+        return (parts[0] == '.git' and
+                (len(parts) == 1 or (parts[1] == 'refs' and (len(parts) == 2 or parts[2] == 'heads'))))
+
+    def watch_git_dir(self, project, root):
+        """Watch the parts of a .git dir below root that commits and branch updates touch."""
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if self.is_git_watch_dir(project, os.path.join(dirpath, d))]
+            if not self.add_watch(project, dirpath, self.tree_mask()):
+                return False
+        return True
+
+    def watch_tree(self, project, root):
+        """Watch root and its subdirectories; returns False if the watch limit was hit."""
+        for dirpath, dirnames, filenames in os.walk(root):
+            if '.git' in dirnames:
+                if not self.watch_git_dir(project, os.path.join(dirpath, '.git')):
+                    return False
+            dirnames[:] = [d for d in dirnames if d != '.git' and not self.skip_dir(project, dirpath, d)]
+            if not self.add_watch(project, dirpath, self.tree_mask()):
+                return False
+        return True
+
+    def add_project(self, name):
+        path = os.path.join(self.projects_dir, name)
+        if not os.path.isdir(path):
+            return
+        fully_watched = self.watch_tree(name, path)
+        with self.lock:
+            self.projects[name] = {'generation': next(self.generations), 'cache': {}}
+            if fully_watched:
+                self.unwatched.discard(name)
+            else:
+                self.unwatched.add(name)
+
+    def remove_project(self, name):
+        self.remove_watches(name)
+        with self.lock:
+            self.projects.pop(name, None)
+            self.unwatched.discard(name)
+
+    def invalidate(self, name):
+        # Caller holds self.lock
+        record = self.projects.get(name)
+        if record:
+            record['generation'] = next(self.generations)
+
+    def handle_event(self, event):
+        watch = self.watches.get(event.wd)
+        if event.mask & inotify_flags.IGNORED:
+            self.watches.pop(event.wd, None)
+            return
+        if watch is None:
+            return
+
+        project, path = watch
+        is_dir = event.mask & inotify_flags.ISDIR
+        added = event.mask & (inotify_flags.CREATE | inotify_flags.MOVED_TO)
+        removed = event.mask & (inotify_flags.DELETE | inotify_flags.MOVED_FROM)
+
+        if project is None:
+            # Projects dir itself: a project was created, removed or renamed
+            if is_dir and added:
+                self.add_project(event.name)
+            elif is_dir and removed:
+                self.remove_project(event.name)
+            return
+
+        with self.lock:
+            self.invalidate(project)
+        if not (is_dir and event.name):
+            return
+
+        child = os.path.join(path, event.name)
+        if removed:
+            self.remove_watches(project, child)
+        elif added:
+            if self.is_git_watch_dir(project, child):
+                # .git from `git init` inside an existing project, or a new refs/heads subdir
+                fully_watched = self.watch_git_dir(project, child)
+            elif self.git_parts(project, path)[0] == '.git' or self.skip_dir(project, path, event.name):
+                fully_watched = True
+            else:
+                fully_watched = self.watch_tree(project, child)
+            with self.lock:
+                # Writes inside the new dir before its watches existed produced no events,
+                # so a value cached in that window must not outlive them
+                self.invalidate(project)
+                if not fully_watched:
+                    self.unwatched.add(project)
+
+    def list_project_names(self):
+        with self.lock:
+            if self.active:
+                return list(self.projects)
+        return os.listdir(self.projects_dir)
+
+    def cached(self, name, kind, compute):
+        with self.lock:
+            record = self.projects.get(name)
+            generation = record['generation'] if record else None
+            if self.active and record and name not in self.unwatched:
+                entry = record['cache'].get(kind)
+                if entry and entry[0] == generation:
+                    return entry[1]
+
+        value = compute()
+
+        with self.lock:
+            record = self.projects.get(name)
+            # Only keep the value if nothing changed while it was being computed
+            if record and record['generation'] == generation:
+                record['cache'][kind] = (generation, value)
+        return value
+
+    def mark_changed(self, name):
+        with self.lock:
+            self.invalidate(name)
+
+project_watcher = ProjectWatcher(PROJECTS_DIR, PROJECT_WATCH_LIMIT)
+
+def read_git_info(project_path):
+    try:
+        import git
+        repo = git.Repo(project_path)
+        return {
+            'branch': repo.active_branch.name,
+            'commit': repo.head.commit.hexsha[:8],
+            'dirty': repo.is_dirty(),
+            'remote': repo.remotes.origin.url if repo.remotes else None
+        }
+    except:
+        return {'error': 'Unable to read git info'}
+
+def read_git_status(project_path):
+    import git
+    repo = git.Repo(project_path)
+    return {
+        'branch': repo.active_branch.name,
+        'commit': repo.head.commit.hexsha[:8],
+        'dirty': repo.is_dirty(),
+        'untracked': [item.a_path for item in repo.index.diff(None)],
+        'modified': [item.a_path for item in repo.index.diff(repo.head.commit)]
+    }
+
 # Project Management Routes
 @app.route('/api/projects', methods=['GET'])
 @login_required
 @roles_required('read-only','operator','admin')
 def list_projects():
     try:
-        projects_dir = os.path.expanduser('~/projects')
+        projects_dir = PROJECTS_DIR
         if not os.path.exists(projects_dir):
             os.makedirs(projects_dir)
+        project_watcher.start()
         
         projects = []
-        for item in os.listdir(projects_dir):
+        for item in project_watcher.list_project_names():
             project_path = os.path.join(projects_dir, item)
             if os.path.isdir(project_path):
                 # Check if it's a git repository
@@ -389,22 +1001,16 @@ def list_projects():
                     'name': item,
                     'path': project_path,
                     'is_git': is_git,
-                    'size': get_directory_size(project_path),
+                    # Sizes can go stale for writes inside unwatched (git-ignored) dirs
+                    # such as node_modules until the next change elsewhere in the project
+                    'size': project_watcher.cached(
+                        item, 'size', lambda: get_directory_size(project_path)),
                     'modified': os.path.getmtime(project_path)
                 }
                 
                 if is_git:
-                    try:
-                        import git
-                        repo = git.Repo(project_path)
-                        project_info['git_info'] = {
-                            'branch': repo.active_branch.name,
-                            'commit': repo.head.commit.hexsha[:8],
-                            'dirty': repo.is_dirty(),
-                            'remote': repo.remotes.origin.url if repo.remotes else None
-                        }
-                    except:
-                        project_info['git_info'] = {'error': 'Unable to read git info'}
+                    project_info['git_info'] = project_watcher.cached(
+                        item, 'git_info', lambda: read_git_info(project_path))
                 
                 projects.append(project_info)
         
@@ -418,29 +1024,28 @@ def list_projects():
 def git_action(project_name, action):
     try:
         import git
-        projects_dir = os.path.expanduser('~/projects')
+        projects_dir = PROJECTS_DIR
         project_path = os.path.join(projects_dir, project_name)
         
         if not os.path.exists(project_path) or not os.path.exists(os.path.join(project_path, '.git')):
             return jsonify(success=False, error='Project not found or not a git repository'), 400
         
-        repo = git.Repo(project_path)
         result = {}
         
         if action == 'pull':
+            repo = git.Repo(project_path)
             origin = repo.remotes.origin
             pull_info = origin.pull()
+            project_watcher.mark_changed(project_name)
             result['message'] = f"Pulled {len(pull_info)} commits"
         elif action == 'status':
-            result['status'] = {
-                'branch': repo.active_branch.name,
-                'commit': repo.head.commit.hexsha[:8],
-                'dirty': repo.is_dirty(),
-                'untracked': [item.a_path for item in repo.index.diff(None)],
-                'modified': [item.a_path for item in repo.index.diff(repo.head.commit)]
-            }
+            project_watcher.start()
+            result['status'] = project_watcher.cached(
+                project_name, 'status', lambda: read_git_status(project_path))
         elif action == 'reset':
+            repo = git.Repo(project_path)
             repo.git.reset('--hard', 'HEAD')
+            project_watcher.mark_changed(project_name)
             result['message'] = 'Repository reset to HEAD'
         else:
             return jsonify(success=False, error='Unknown git action'), 400
@@ -449,6 +1054,111 @@ def git_action(project_name, action):
     except Exception as e:
         return jsonify(success=False, error=str(e)), 400
 
+# Network Monitoring
+NETWORK_SAMPLE_INTERVAL = int(os.getenv('NETWORK_SAMPLE_INTERVAL', '2'))  # seconds
+NETWORK_HISTORY_SIZE = 150  # samples kept per interface (5 minutes at 2s)
+
+def read_wifi_signal():
+    # /proc/net/wireless lists one line per wireless interface after two header lines:
+    # "wlan0: 0000   54.  -56.  -256 ..." where the fourth column is the signal level in dBm
+    try:
+        with open('/proc/net/wireless') as f:
+            lines = f.readlines()[2:]
+    except OSError:
+        return None
+    for line in lines:
+        parts = line.split()
+        if len(parts) >= 4:
+            try:
+                return str(int(float(parts[3])))
+            except ValueError:
+                continue
+    return None
+
+class NetworkSampler:
+    """Samples per-interface counters on a fixed interval and keeps rates in memory."""
+
+    def __init__(self, interval, history_size):
+        self.interval = interval
+        self.history_size = history_size
+        self.lock = threading.Lock()
+        self.thread = None
+        self.previous = None
+        self.previous_time = None
+        self.counters = {}
+        self.rates = {}
+        self.history = {}
+        self.wifi_signal = None
+
+    def start(self):
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self.run, name='network-sampler', daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"⚠️  Network sampling failed: {e}")
+            time.sleep(self.interval)
+
+    def sample(self):
+        import psutil
+
+        wifi_signal = read_wifi_signal()
+
+        # The spacing check, counter read and update happen under one lock so an inline
+        # request sample and the sampler thread can't interleave or roll back `previous`
+        with self.lock:
+            now = time.monotonic()
+            if self.previous_time is not None and now - self.previous_time < self.interval / 2:
+                return  # Too close to the last sample for a meaningful rate
+            counters = psutil.net_io_counters(pernic=True)
+
+            if self.previous is not None:
+                elapsed = now - self.previous_time
+                for interface, current in counters.items():
+                    last = self.previous.get(interface)
+                    if last is None or elapsed <= 0:
+                        continue
+                    # Counters can wrap or reset when an interface goes down; clamp to zero
+                    rate = {
+                        'rx_bytes_per_sec': max(current.bytes_recv - last.bytes_recv, 0) / elapsed,
+                        'tx_bytes_per_sec': max(current.bytes_sent - last.bytes_sent, 0) / elapsed,
+                        'rx_packets_per_sec': max(current.packets_recv - last.packets_recv, 0) / elapsed,
+                        'tx_packets_per_sec': max(current.packets_sent - last.packets_sent, 0) / elapsed,
+                    }
+                    rate = {key: round(value, 2) for key, value in rate.items()}
+                    self.rates[interface] = rate
+                    history = self.history.setdefault(interface, deque(maxlen=self.history_size))
+                    history.append(dict(rate, timestamp=time.time()))
+
+                # Forget interfaces that have disappeared
+                for interface in list(self.rates):
+                    if interface not in counters:
+                        self.rates.pop(interface, None)
+                        self.history.pop(interface, None)
+
+            self.previous = counters
+            self.previous_time = now
+            self.counters = counters
+            self.wifi_signal = wifi_signal
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.counters), dict(self.rates), self.wifi_signal
+
+    def get_history(self, interface=None):
+        with self.lock:
+            if interface is not None:
+                return {interface: list(self.history.get(interface, []))}
+            return {name: list(samples) for name, samples in self.history.items()}
+
+network_sampler = NetworkSampler(NETWORK_SAMPLE_INTERVAL, NETWORK_HISTORY_SIZE)
+
 # Network Monitoring Routes
 @app.route('/api/network/status', methods=['GET'])
 @login_required
@@ -456,48 +1166,58 @@ def git_action(project_name, action):
 def network_status():
     try:
         import psutil
-        
+
+        network_sampler.start()
+        counters, rates, wifi_signal = network_sampler.snapshot()
+        if not counters:
+            # First request before the sampler has run: take one sample inline
+            network_sampler.sample()
+            counters, rates, wifi_signal = network_sampler.snapshot()
+
         # Get network interfaces
+        if_stats = psutil.net_if_stats()
         interfaces = {}
         for interface, addrs in psutil.net_if_addrs().items():
             if interface != 'lo':  # Skip loopback
+                nic = counters.get(interface)
                 interfaces[interface] = {
                     'addresses': [addr.address for addr in addrs],
-                    'is_up': psutil.net_if_stats()[interface].isup
+                    'is_up': if_stats[interface].isup if interface in if_stats else False,
+                    'bytes_sent': nic.bytes_sent if nic else 0,
+                    'bytes_recv': nic.bytes_recv if nic else 0,
+                    'rates': rates.get(interface)
                 }
-        
-        # Get WiFi signal strength (if available)
-        wifi_signal = None
-        try:
-            iwconfig_result = subprocess.run(['iwconfig'], capture_output=True, text=True, timeout=5)
-            if iwconfig_result.returncode == 0:
-                output = iwconfig_result.stdout
-                for line in output.split('\n'):
-                    if 'Signal level' in line:
-                        signal_match = line.split('Signal level=')[1].split(' ')[0]
-                        wifi_signal = signal_match
-                        break
-        except:
-            pass
-        
+
         # Get network statistics
-        net_stats = psutil.net_io_counters()
-        
         result = {
             'interfaces': interfaces,
             'wifi_signal': wifi_signal,
+            'sample_interval': network_sampler.interval,
             'stats': {
-                'bytes_sent': net_stats.bytes_sent,
-                'bytes_recv': net_stats.bytes_recv,
-                'packets_sent': net_stats.packets_sent,
-                'packets_recv': net_stats.packets_recv
+                'bytes_sent': sum(nic.bytes_sent for nic in counters.values()),
+                'bytes_recv': sum(nic.bytes_recv for nic in counters.values()),
+                'packets_sent': sum(nic.packets_sent for nic in counters.values()),
+                'packets_recv': sum(nic.packets_recv for nic in counters.values())
             }
         }
-        
+
         return jsonify(success=True, network=result)
     except Exception as e:
         return jsonify(success=False, error=str(e)), 400
 
+@app.route('/api/network/history', methods=['GET'])
+@login_required
+@roles_required('read-only','operator','admin')
+def network_history():
+    try:
+        network_sampler.start()
+        interface = request.args.get('interface')
+        return jsonify(success=True,
+                       interval=network_sampler.interval,
+                       history=network_sampler.get_history(interface))
+    except Exception as e:
+        return jsonify(success=False, error=str(e)), 400
+
 @app.route('/api/network/scan', methods=['POST'])
 @login_required
 @roles_required('operator','admin')
@@ -603,8 +1323,7 @@ def get_directory_size(path):
 @roles_required('operator','admin')
 def start_container(container_id):
     try:
-        container = docker_client.containers.get(container_id)
-        container.start()
+        docker_call('stop', lambda: docker_client.api.start(container_id))
         log = AuditLog(user_id=current_user.id, action='start', container_id=container_id)
         db.session.add(log)
         db.session.commit()
@@ -617,8 +1336,7 @@ def start_container(container_id):
 @roles_required('operator','admin')
 def stop_container(container_id):
     try:
-        container = docker_client.containers.get(container_id)
-        container.stop()
+        docker_call('stop', lambda: docker_client.api.stop(container_id))
         log = AuditLog(user_id=current_user.id, action='stop', container_id=container_id)
         db.session.add(log)
         db.session.commit()
@@ -631,8 +1349,7 @@ def stop_container(container_id):
 @roles_required('operator','admin')
 def restart_container(container_id):
     try:
-        container = docker_client.containers.get(container_id)
-        container.restart()
+        docker_call('stop', lambda: docker_client.api.restart(container_id))
         log = AuditLog(user_id=current_user.id, action='restart', container_id=container_id)
         db.session.add(log)
         db.session.commit()
@@ -0,0 +1,120 @@
+"""Static asset pipeline for the dashboard.
+
+Bundles the page scripts and the vendored CSS (committed under static/vendor so the
+Pi never needs a CDN), fingerprints every output by content hash and pre-compresses
+it with gzip/brotli into static/dist. Run ``python assets.py`` before starting the
+app; the Dockerfile does this at build time. Without a build the app serves the
+unbundled sources.
+"""
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+import re
+import shutil
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+MANIFEST_PATH = os.path.join(DIST_DIR, 'manifest.json')
+
+# Logical asset name -> source files under static/, concatenated in order.
+# vendor/tailwind.min.css is compiled from the templates, see tailwind.config.js
+BUNDLES = {
+    'css/tailwind.css': ['vendor/tailwind.min.css'],
+    'css/font-awesome.css': ['vendor/font-awesome/css/all.min.css'],
+    'js/home.js': ['js/dashboard.js'],
+    'js/admin.js': ['js/container-control.js', 'js/rpi-dashboard.js'],
+}
+
+# Formats like woff2 are already compressed
+COMPRESSIBLE_EXTENSIONS = ('.js', '.css', '.svg', '.ttf', '.eot', '.json')
+
+CSS_URL_PATTERN = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+def is_relative_ref(ref):
+    return bool(ref) and not ref.startswith(('data:', 'http:', 'https:', '//', '/', '#'))
+
+def write_fingerprinted(name, content):
+    # name.ext -> name.<hash>.ext, plus .gz/.br siblings for compressible types
+    stem, ext = os.path.splitext(name)
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    hashed_name = f"{stem}.{digest}{ext}"
+    path = os.path.join(DIST_DIR, hashed_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(content)
+    if ext in COMPRESSIBLE_EXTENSIONS:
+        with open(path + '.gz', 'wb') as f:
+            f.write(gzip.compress(content, compresslevel=9, mtime=0))
+        if BROTLI_AVAILABLE:
+            with open(path + '.br', 'wb') as f:
+                f.write(brotli.compress(content, quality=11))
+    return hashed_name
+
+def build_css(name, source, emitted):
+    path = os.path.join(STATIC_DIR, source)
+    with open(path, encoding='utf-8') as f:
+        css = f.read()
+
+    def rewrite(match):
+        ref = match.group(2)
+        clean_ref = ref.split('?')[0].split('#')[0]
+        if not is_relative_ref(clean_ref):
+            return match.group(0)
+        ref_path = os.path.normpath(os.path.join(os.path.dirname(path), clean_ref))
+        ref_name = os.path.relpath(ref_path, STATIC_DIR).replace(os.sep, '/')
+        if ref_name not in emitted:
+            with open(ref_path, 'rb') as f:
+                emitted[ref_name] = write_fingerprinted(ref_name, f.read())
+        # Relative to where the bundle lands, so the CSS works under any URL prefix
+        new_ref = posixpath.relpath(emitted[ref_name], posixpath.dirname(name)) + ref[len(clean_ref):]
+        return f"url({match.group(1)}{new_ref}{match.group(1)})"
+
+    return CSS_URL_PATTERN.sub(rewrite, css).encode('utf-8')
+
+def build_assets():
+    shutil.rmtree(DIST_DIR, ignore_errors=True)
+    os.makedirs(DIST_DIR)
+
+    manifest = {}
+    emitted = {}  # files referenced from CSS, fingerprinted once
+    for name, sources in BUNDLES.items():
+        missing = [s for s in sources if not os.path.exists(os.path.join(STATIC_DIR, s))]
+        if missing:
+            # Left out of the manifest, so the app keeps serving whatever sources exist
+            print(f"⚠️  Skipping {name}: missing {', '.join(missing)}")
+            continue
+        parts = []
+        for source in sources:
+            if source.endswith('.css'):
+                parts.append(build_css(name, source, emitted))
+            else:
+                with open(os.path.join(STATIC_DIR, source), 'rb') as f:
+                    parts.append(f.read())
+        # Separate concatenated scripts so a missing trailing semicolon can't join statements
+        separator = b'\n;\n' if name.endswith('.js') else b'\n'
+        manifest[name] = write_fingerprinted(name, separator.join(parts))
+        print(f"📦 {name} -> dist/{manifest[name]}")
+
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+if __name__ == '__main__':
+    build_assets()
+    if not BROTLI_AVAILABLE:
+        print("⚠️  brotli not installed - only gzip variants were written")
@@ -80,42 +80,147 @@ document.addEventListener('DOMContentLoaded', function() {
         return date.toLocaleString();
     }
     
-    // Container action handlers
+    // Container table, loaded one page at a time from /api/containers
+    const containersBody = document.getElementById('containers-body');
+    const filtersForm = document.getElementById('container-filters');
+    const prevButton = document.getElementById('containers-prev');
+    const nextButton = document.getElementById('containers-next');
+    let containersPage = 1;
+    let containersPages = 1;
+    
+    function escapeHtml(value) {
+        const div = document.createElement('div');
+        div.textContent = value == null ? '' : String(value);
+        return div.innerHTML;
+    }
+    
+    function renderContainerRow(container) {
+        const isRunning = container.status === 'running';
+        const name = `<span class="truncate max-w-[100px] md:max-w-[200px] inline-block">${escapeHtml(container.name)}</span>`;
+        const image = container.image.length > 25 ? `${escapeHtml(container.image.slice(0, 25))}&hellip;` : escapeHtml(container.image);
+        
+        return `
+            <tr class="hover:bg-gray-50" data-container-id="${escapeHtml(container.id)}">
+                <td class="py-2 px-2 md:px-4 border-b text-center align-middle">
+                    ${container.host_port ? `
+                        <a href="${escapeHtml(container.url)}" target="_blank" class="text-blue-600 hover:underline flex items-center gap-1 justify-center">
+                            <i class="fas fa-external-link-alt"></i> ${name}
+                        </a>
+                    ` : name}
+                </td>
+                <td class="py-2 px-2 md:px-4 border-b text-center align-middle">
+                    <span class="px-2 py-1 rounded-full text-xs font-medium ${isRunning ? 'bg-green-100 text-green-800' : 'bg-red-100 text-red-800'}">
+                        ${escapeHtml(container.status)}
+                    </span>
+                </td>
+                <td class="py-2 px-2 md:px-4 border-b max-w-xs truncate text-center align-middle hidden md:table-cell" title="${escapeHtml(container.image)}">
+                    ${image}
+                </td>
+                <td class="py-2 px-2 md:px-4 border-b text-center align-middle">
+                    <div class="flex flex-wrap md:flex-nowrap space-x-2 container-actions justify-center items-center">
+                        ${isRunning ? `
+                            <a href="#" class="text-red-500 hover:text-red-700" data-action="stop" title="Stop Container">
+                                <i class="fas fa-stop"></i>
+                            </a>
+                        ` : `
+                            <a href="#" class="text-green-500 hover:text-green-700" data-action="start" title="Start Container">
+                                <i class="fas fa-play"></i>
+                            </a>
+                        `}
+                        <a href="#" class="text-blue-500 hover:text-blue-700" data-action="restart" title="Restart Container">
+                            <i class="fas fa-redo"></i>
+                        </a>
+                        <a href="#" class="text-gray-500 hover:text-gray-700" data-action="info" title="Container Details">
+                            <i class="fas fa-info-circle"></i>
+                        </a>
+                        ${isRunning ? `
+                            <a href="#" class="text-yellow-500 hover:text-yellow-700" data-action="logs" title="View Logs">
+                                <i class="fas fa-file-alt"></i>
+                            </a>
+                            <a href="#" class="text-purple-500 hover:text-purple-700" data-action="stats" title="Resource Usage">
+                                <i class="fas fa-chart-line"></i>
+                            </a>
+                        ` : ''}
+                    </div>
+                </td>
+            </tr>
+        `;
+    }
+    
+    async function loadContainers(page = containersPage) {
+        const params = new URLSearchParams({page: page});
+        new FormData(filtersForm).forEach((value, key) => {
+            if (value) params.append(key, value);
+        });
+        
+        try {
+            const response = await fetch(`/api/containers?${params}`);
+            const data = await response.json();
+            if (!data.success) {
+                showToast(`Error: ${data.error}`, 'error');
+                return;
+            }
+            
+            containersPage = data.page;
+            containersPages = Math.max(data.pages, 1);
+            containersBody.innerHTML = data.containers.length > 0
+                ? data.containers.map(renderContainerRow).join('')
+                : '<tr><td colspan="4" class="py-4 text-center text-gray-500">No containers found</td></tr>';
+            
+            document.getElementById('containers-summary').textContent = `${data.total} containers`;
+            document.getElementById('containers-page').textContent = `${containersPage} / ${containersPages}`;
+            prevButton.disabled = containersPage <= 1;
+            nextButton.disabled = containersPage >= containersPages;
+        } catch (error) {
+            showToast(`Request failed: ${error}`, 'error');
+        }
+    }
+    
+    filtersForm.addEventListener('submit', (e) => {
+        e.preventDefault();
+        loadContainers(1);
+    });
+    prevButton.addEventListener('click', () => loadContainers(containersPage - 1));
+    nextButton.addEventListener('click', () => loadContainers(containersPage + 1));
+    
+    // Container action handlers (delegated, rows are re-rendered on every page load)
     let currentContainerId = null;
     let statsInterval = null;
     
-    document.querySelectorAll('.container-actions a').forEach(link => {
-        link.addEventListener('click', async function(e) {
-            e.preventDefault();
-            const row = this.closest('tr');
-            const containerId = row.getAttribute('data-container-id');
-            currentContainerId = containerId;
-            const action = this.getAttribute('data-action');
-            const containerName = row.querySelector('td:first-child').textContent.trim();
-            
-            // Handle different actions
-            switch (action) {
-                case 'info':
-                    await showContainerDetails(containerId);
-                    break;
-                    
-                case 'logs':
-                    await showContainerLogs(containerId, containerName);
-                    break;
-                    
-                case 'stats':
-                    await showContainerDetails(containerId, true); // true = focus on stats
-                    break;
-                    
-                case 'start':
-                case 'stop':
-                case 'restart':
-                    showConfirmation(action, containerId, containerName);
-                    break;
-            }
-        });
+    containersBody.addEventListener('click', async function(e) {
+        const link = e.target.closest('.container-actions a');
+        if (!link) return;
+        e.preventDefault();
+        const row = link.closest('tr');
+        const containerId = row.getAttribute('data-container-id');
+        currentContainerId = containerId;
+        const action = link.getAttribute('data-action');
+        const containerName = row.querySelector('td:first-child').textContent.trim();
+        
+        // Handle different actions
+        switch (action) {
+            case 'info':
+                await showContainerDetails(containerId);
+                break;
+                
+            case 'logs':
+                await showContainerLogs(containerId, containerName);
+                break;
+                
+            case 'stats':
+                await showContainerDetails(containerId, true); // true = focus on stats
+                break;
+                
+            case 'start':
+            case 'stop':
+            case 'restart':
+                showConfirmation(action, containerId, containerName);
+                break;
+        }
     });
     
+    loadContainers(1);
+    
     // Show container details
     async function showContainerDetails(containerId, focusStats = false) {
         try {
@@ -169,15 +274,62 @@ document.addEventListener('DOMContentLoaded', function() {
                 portsContainer.innerHTML = '<p>No ports exposed</p>';
             }
             
+            // Volumes and environment are heavy, so they are only fetched on request
+            ['container-volumes', 'container-env'].forEach(id => {
+                const section = document.getElementById(id);
+                section.innerHTML = '';
+                const loadButton = document.createElement('button');
+                loadButton.className = 'text-blue-500 hover:text-blue-700 text-sm';
+                loadButton.innerHTML = '<i class="fas fa-download mr-1"></i>Load';
+                loadButton.addEventListener('click', () => loadContainerExtras(containerId));
+                section.appendChild(loadButton);
+            });
+            
+            // Start fetching stats if container is running
+            if (data.info.status === 'running') {
+                fetchContainerStats(containerId);
+                // Set up interval to update stats every 2 seconds
+                clearInterval(statsInterval);
+                statsInterval = setInterval(() => {
+                    fetchContainerStats(containerId);
+                }, 2000);
+            } else {
+                document.getElementById('container-cpu').textContent = 'N/A';
+                document.getElementById('container-memory').textContent = 'N/A';
+                document.getElementById('container-network').textContent = 'N/A';
+                document.getElementById('cpu-bar').style.width = '0%';
+                document.getElementById('memory-bar').style.width = '0%';
+            }
+            
+        } catch (error) {
+            showToast(`Request failed: ${error}`, 'error');
+        }
+    }
+    
+    // Fetch and render the lazily loaded volumes and environment variables
+    async function loadContainerExtras(containerId) {
+        try {
+            const response = await fetch(`/container/${containerId}/info?include=env,volumes`, {
+                method: 'GET',
+                headers: {'Content-Type': 'application/json'}
+            });
+            
+            const data = await response.json();
+            if (!data.success) {
+                showToast(`Error: ${data.error}`, 'error');
+                return;
+            }
+            const info = data.info;
+            
             // Fill in volumes
             const volumesContainer = document.getElementById('container-volumes');
             volumesContainer.innerHTML = '';
             
-            if (data.info.volumes && data.info.volumes.length > 0) {
+            if (info.volumes && info.volumes.length > 0) {
                 const volumesList = document.createElement('ul');
                 volumesList.className = 'list-disc pl-5';
                 
-                data.info.volumes.forEach(volume => {
+                info.volumes.forEach(volume => {
                     const volumeItem = document.createElement('li');
                     volumeItem.textContent = volume;
                     volumesList.appendChild(volumeItem);
@@ -192,11 +344,11 @@ document.addEventListener('DOMContentLoaded', function() {
             const envContainer = document.getElementById('container-env');
             envContainer.innerHTML = '';
             
-            if (data.info.env && data.info.env.length > 0) {
+            if (info.env && info.env.length > 0) {
                 const envTable = document.createElement('table');
                 envTable.className = 'min-w-full';
                 
-                data.info.env.forEach(env => {
+                info.env.forEach(env => {
                     const row = document.createElement('tr');
                     const parts = env.split('=');
                     const key = parts[0];
@@ -214,23 +366,6 @@ document.addEventListener('DOMContentLoaded', function() {
             } else {
                 envContainer.innerHTML = '<p>No environment variables</p>';
             }
-            
-            // Start fetching stats if container is running
-            if (data.info.status === 'running') {
-                fetchContainerStats(containerId);
-                // Set up interval to update stats every 2 seconds
-                clearInterval(statsInterval);
-                statsInterval = setInterval(() => {
-                    fetchContainerStats(containerId);
-                }, 2000);
-            } else {
-                document.getElementById('container-cpu').textContent = 'N/A';
-                document.getElementById('container-memory').textContent = 'N/A';
-                document.getElementById('container-network').textContent = 'N/A';
-                document.getElementById('cpu-bar').style.width = '0%';
-                document.getElementById('memory-bar').style.width = '0%';
-            }
-            
         } catch (error) {
             showToast(`Request failed: ${error}`, 'error');
         }
@@ -350,7 +485,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 const data = await response.json();
                 if (data.success) {
                     showToast(`Container ${action}ed successfully!`, 'success');
-                    setTimeout(() => window.location.reload(), 1000);
+                    setTimeout(() => loadContainers(), 1000);
                 } else {
                     showToast(`Error: ${data.error}`, 'error');
                 }
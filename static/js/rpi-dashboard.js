@@ -73,8 +73,10 @@ class RpiDashboard {
             if (this.currentTab === 'system') {
                 this.loadSystemStats();
                 this.loadRpiStats();
+            } else if (this.currentTab === 'network') {
+                this.loadNetworkStatus();
             }
-        }, 5000); // Refresh every 5 seconds for system tab
+        }, 5000); // Refresh every 5 seconds for system and network tabs
 
         // Initial load
         this.loadSystemStats();
@@ -338,6 +340,12 @@ class RpiDashboard {
                 <div class="text-sm text-gray-600 mt-1">
                     ${info.addresses.join(', ')}
                 </div>
+                ${info.rates ? `
+                    <div class="grid grid-cols-2 gap-2 text-xs text-gray-600 mt-2">
+                        <div>↓ ${this.formatBytes(info.rates.rx_bytes_per_sec)}/s (${info.rates.rx_packets_per_sec.toFixed(1)} pkt/s)</div>
+                        <div>↑ ${this.formatBytes(info.rates.tx_bytes_per_sec)}/s (${info.rates.tx_packets_per_sec.toFixed(1)} pkt/s)</div>
+                    </div>
+                ` : ''}
             </div>
         `).join('');
         
@@ -0,0 +1,9 @@
+// Regenerate static/vendor/tailwind.min.css after changing classes:
+//   npx tailwindcss@3 -c tailwind.config.js -o static/vendor/tailwind.min.css --minify
+module.exports = {
+  content: ['./templates/**/*.html', './static/js/**/*.js'],
+  theme: {
+    extend: {},
+  },
+  plugins: [],
+}